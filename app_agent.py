@@ -7,19 +7,132 @@ Shows the full CoVe workflow with streaming results:
 3. Comparison and final result
 """
 
+import asyncio
 import streamlit as st
 import sys
 import os
-import json
-import toml
+import html
+import re
+import orjson
+import pyarrow as pa
 import time
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from src.config import SNOWFLAKE_CONFIG_PATH, load_toml
 from src.cortex.agent import CortexAgentClient, AgentResponse
-from dataclasses import dataclass, field
+from src.cortex.cache import CachedCortexAgent, LLMCache
+from dataclasses import dataclass, field, replace
 from typing import Optional, Any
 
+# Upper bound on concurrent verification requests to the agent
+MAX_VERIFICATION_WORKERS = 8
+
+# Static page HTML, emitted with st.html to skip markdown parsing on every rerun
+_CSS = """
+<style>
+    .step-header {
+        background: linear-gradient(90deg, #1e3a5f 0%, #2d5a87 100%);
+        color: white;
+        padding: 15px;
+        border-radius: 10px;
+        margin: 20px 0 10px 0;
+    }
+    .consistent { background-color: #1b4332; border-left: 4px solid #40916c; padding: 10px; margin: 5px 0; }
+    .inconsistent { background-color: #3d1e1e; border-left: 4px solid #d62828; padding: 10px; margin: 5px 0; }
+    .unverified { background-color: #3d3d1e; border-left: 4px solid #f4a261; padding: 10px; margin: 5px 0; }
+    .claim-box { border: 1px solid #444; border-radius: 8px; padding: 15px; margin: 10px 0; }
+</style>
+"""
+
+_STEP1_HEADER = '<div class="step-header"><h2>📤 STEP 1: Initial Agent Response</h2></div>'
+_STEP2_HEADER = '<div class="step-header"><h2>🔍 STEP 2: Independent Verification (Streaming)</h2></div>'
+_STEP3_HEADER = '<div class="step-header"><h2>📊 STEP 3: Comparison & Final Result</h2></div>'
+
+# Sidebar sample questions as (question, button label, widget key), built once
+_SAMPLE_QUESTIONS = tuple(
+    (q, q[:40] + "..." if len(q) > 40 else q, f"sample_{i}")
+    for i, q in enumerate([
+        "What was total revenue in Q4 2024?",
+        "What is our return policy for electronics?",
+        "Tell me about the SmartWatch Pro product",
+        "Which customer segment had highest revenue?",
+        "What was Enterprise revenue in Q4 2024 and what products do we have?",
+    ])
+)
+
+# Static prompt scaffolds, sent ahead of the per-call text so every request
+# for a stage shares an identical prefix the model can serve from its prompt cache
+EXTRACTION_SYSTEM = """Analyze the response below and list all specific factual claims that can be verified.
+
+For each claim, provide:
+1. The exact claim made
+2. A verification question to check it
+3. Whether to use "analyst" (for data/numbers) or "search" (for policies/knowledge/products)
+
+Respond ONLY with valid JSON matching:
+{"claims": [{"claim": str, "question": str, "source": "analyst" | "search"}]}"""
+
+VERIFICATION_SYSTEM = """Answer the verification question below using your tools.
+Then compare the ORIGINAL CLAIM against your answer.
+
+Respond ONLY with JSON in this format:
+{"verified_text": "<your answer to the verification question>", "verdict": "CONSISTENT|INCONSISTENT|UNVERIFIED", "explanation": "<why>"}
+
+Verdicts:
+- CONSISTENT: if the claim matches the verified information
+- INCONSISTENT: if the claim contradicts the verified information
+- UNVERIFIED: if you cannot determine from the information"""
+
+BATCH_VERIFICATION_SYSTEM = """For each numbered claim below, answer its verification question using your tools.
+Then compare the claim against your answer.
+
+Respond ONLY with JSON in this format:
+{"results": [{"claim_idx": <claim number>, "verified_text": "<your answer to the verification question>", "verdict": "CONSISTENT|INCONSISTENT|UNVERIFIED", "explanation": "<why>"}]}
+
+Verdicts:
+- CONSISTENT: if the claim matches the verified information
+- INCONSISTENT: if the claim contradicts the verified information
+- UNVERIFIED: if you cannot determine from the information"""
+
+CORRECTION_SYSTEM = """Generate a corrected response based on the verification results below.
+Revise the original response so that each listed INCONSISTENT claim is corrected using its verified information.
+Keep everything else in the original response unchanged."""
+
+# One CLAIM/QUESTION/SOURCE block, for extraction replies that ignore the JSON format
+_CLAIM_RE = re.compile(
+    r"^[ \t]*CLAIM:[ \t]*(?P<claim>\S.*?)\s*$"
+    r"(?:\s*^[ \t]*QUESTION:[ \t]*(?P<question>\S.*?)\s*$)?"
+    r"(?:\s*^[ \t]*SOURCE:[ \t]*(?P<source>.*?)\s*$)?",
+    re.MULTILINE,
+)
+
+# Rendering for each is_consistent value: (icon, label, card CSS class)
+_STATUS = {
+    True: ("✅", "CONSISTENT", "consistent"),
+    False: ("❌", "INCONSISTENT", "inconsistent"),
+    None: ("⚠️", "UNVERIFIED", "unverified"),
+}
+
+# Verification card; kept free of blank lines, which would end the HTML block
+_CARD_TEMPLATE = (
+    '<div class="claim-box">'
+    "<h4>{icon} Claim {index}: {claim} [{label}]</h4>"
+    "<p><b>Verification Question:</b> {question}<br>"
+    "<b>Source:</b> <code>{source}</code></p>"
+    "<p><b>🔎 Verified Information:</b><br>{verified}</p>"
+    "{sql_block}"
+    '<div class="{css_class}"><b>⚖️ Comparison:</b> {explanation}</div>'
+    "</div>"
+)
+
+# Verdict at the start of a reply, after any markdown or punctuation
+_VERDICT_RE = re.compile(r"\W*(INCONSISTENT|CONSISTENT|UNVERIFIED)", re.IGNORECASE)
+_VERDICTS = {"CONSISTENT": True, "INCONSISTENT": False, "UNVERIFIED": None}
+
+# Outermost {...} span in a reply that wraps its JSON in prose or code fences
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
 
 def get_pat_from_config() -> str:
     """Get PAT from config.toml or environment variable."""
@@ -27,11 +140,9 @@ def get_pat_from_config() -> str:
     if pat:
         return pat
     
-    config_path = os.path.expanduser("~/.snowflake/config.toml")
-    if os.path.exists(config_path):
+    if os.path.exists(SNOWFLAKE_CONFIG_PATH):
         try:
-            with open(config_path, "r") as f:
-                toml_config = toml.load(f)
+            toml_config = load_toml(SNOWFLAKE_CONFIG_PATH)
             conn = toml_config.get("connections", {}).get("default", {})
             return conn.get("password", "")
         except Exception:
@@ -39,28 +150,24 @@ def get_pat_from_config() -> str:
     return ""
 
 
+@st.cache_resource(show_spinner=False)
+def get_llm_cache() -> LLMCache:
+    """Get the response cache shared across reruns and sessions."""
+    return LLMCache()
+
+
+@st.cache_resource(show_spinner=False)
+def get_agent_client() -> CachedCortexAgent:
+    """Get the agent client shared across reruns, keeping its connection pool warm."""
+    return CachedCortexAgent(CortexAgentClient(), get_llm_cache())
+
+
 st.set_page_config(
     page_title="CoVe - Chain of Verification",
     page_icon="🔍",
     layout="wide"
 )
 
-st.markdown("""
-<style>
-    .step-header {
-        background: linear-gradient(90deg, #1e3a5f 0%, #2d5a87 100%);
-        color: white;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 20px 0 10px 0;
-    }
-    .consistent { background-color: #1b4332; border-left: 4px solid #40916c; padding: 10px; margin: 5px 0; }
-    .inconsistent { background-color: #3d1e1e; border-left: 4px solid #d62828; padding: 10px; margin: 5px 0; }
-    .unverified { background-color: #3d3d1e; border-left: 4px solid #f4a261; padding: 10px; margin: 5px 0; }
-    .claim-box { border: 1px solid #444; border-radius: 8px; padding: 15px; margin: 10px 0; }
-</style>
-""", unsafe_allow_html=True)
-
 
 def init_session_state():
     if "cove_running" not in st.session_state:
@@ -69,7 +176,7 @@ def init_session_state():
         st.session_state.selected_query = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaimVerification:
     """Verification result for a single claim."""
     claim: str
@@ -120,9 +227,7 @@ def display_agent_response(response: AgentResponse, title: str, container=None):
                                     columns = [col["name"] for col in meta.get("rowType", [])]
                                     data = result_set.get("data", [])
                                     if columns and data:
-                                        import pandas as pd
-                                        df = pd.DataFrame(data, columns=columns)
-                                        st.dataframe(df, use_container_width=True)
+                                        st.dataframe(_result_table(columns, data), use_container_width=True)
                             # Show search results
                             if "results" in json_data:
                                 st.json(json_data["results"][:3] if len(json_data.get("results", [])) > 3 else json_data["results"])
@@ -133,143 +238,257 @@ def display_agent_response(response: AgentResponse, title: str, container=None):
             st.text(response.thinking_text)
 
 
+def _result_table(columns: list[str], data: list[list]) -> pa.Table | list[dict]:
+    """Build a displayable table from a tool result set."""
+    # Pad or trim ragged rows so every column lines up with its values
+    rows = [row[:len(columns)] + [None] * (len(columns) - len(row)) for row in data]
+    try:
+        # Columnar Arrow table: no pandas copy or dtype inference
+        return pa.Table.from_arrays(
+            [pa.array(values) for values in zip(*rows)],
+            names=columns,
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        # Mixed-type columns (e.g. VARIANT values) and integers beyond int64
+        # (e.g. NUMBER(38,0)) have no single inferable Arrow type
+        return [dict(zip(columns, row)) for row in rows]
+
+
+def stream_agent_response(client: CortexAgentClient, message: str, container, **kwargs) -> AgentResponse:
+    """Render the agent's answer into a container as it streams, then return the full response."""
+    response = None
+    
+    def texts():
+        nonlocal response
+        response = yield from client.stream(message, **kwargs)
+    
+    container.write_stream(texts())
+    return response
+
+
 def extract_claims(client: CortexAgentClient, query: str, response_text: str) -> tuple[list[dict], AgentResponse]:
     """Extract claims from the response."""
-    extraction_prompt = f"""Analyze this response and list all specific factual claims that can be verified.
-
-Original Question: {query}
+    extraction_prompt = f"""Original Question: {query}
 
 Response to Analyze:
-{response_text}
+{response_text}"""
 
-For each claim, provide:
-1. The exact claim made
-2. A verification question to check it
-3. Whether to use "analyst" (for data/numbers) or "search" (for policies/knowledge/products)
+    extract_response = client.run(extraction_prompt, system_prompt=EXTRACTION_SYSTEM)
+    
+    return _parse_claims(extract_response.text), extract_response
 
-List each claim in this format:
-CLAIM: [the claim]
-QUESTION: [verification question]
-SOURCE: [analyst or search]
----"""
-
-    extract_response = client.run(extraction_prompt)
-    
-    # Parse claims
-    claims = []
-    current_claim = {}
-    
-    for line in extract_response.text.split('\n'):
-        line = line.strip()
-        if line.startswith('CLAIM:'):
-            if current_claim.get('claim'):
-                claims.append(current_claim)
-            current_claim = {'claim': line[6:].strip()}
-        elif line.startswith('QUESTION:'):
-            current_claim['verification_question'] = line[9:].strip()
-        elif line.startswith('SOURCE:'):
-            source = line[7:].strip().lower()
-            current_claim['source'] = 'analyst' if 'analyst' in source else 'search'
-        elif line == '---' and current_claim.get('claim'):
-            claims.append(current_claim)
-            current_claim = {}
-    
-    if current_claim.get('claim'):
-        claims.append(current_claim)
-    
-    # Ensure all claims have required fields
-    for claim in claims:
-        if 'verification_question' not in claim:
-            claim['verification_question'] = f"Verify: {claim['claim']}"
-        if 'source' not in claim:
-            claim['source'] = 'analyst'
-    
-    return claims, extract_response
-
-
-def verify_claim(client: CortexAgentClient, claim: dict) -> ClaimVerification:
-    """Verify a single claim independently."""
-    question = claim.get('verification_question', '')
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def cached_extract_claims(_client: CortexAgentClient, query: str, response_text: str) -> tuple[list[dict], AgentResponse]:
+    """extract_claims memoized on the query and response text."""
+    return extract_claims(_client, query, response_text)
+
+
+def _parse_claims(text: str) -> list[dict]:
+    """Parse the extraction reply, falling back to CLAIM:/QUESTION:/SOURCE: lines."""
+    data = _parse_json_object(text)
+    items = data.get('claims') if data else None
     
-    # Query agent independently (factored verification)
-    verification_response = client.run(question)
+    if isinstance(items, list):
+        found = [
+            (str(item['claim']).strip(), str(item.get('question') or '').strip(), str(item.get('source') or ''))
+            for item in items
+            if isinstance(item, dict) and item.get('claim')
+        ]
+    else:
+        # QUESTION and SOURCE lines are optional
+        found = [(m['claim'], m['question'] or '', m['source'] or '') for m in _CLAIM_RE.finditer(text)]
     
-    # Compare original claim with verification
-    comparison_prompt = f"""Compare these two statements and determine if they are consistent.
+    return [
+        {
+            'claim': claim,
+            'verification_question': question or f"Verify: {claim}",
+            'source': 'analyst' if not source or 'analyst' in source.lower() else 'search',
+        }
+        for claim, question, source in found
+    ]
+
+
+def _parse_json_object(text: str) -> Optional[dict]:
+    """Parse a JSON object from an LLM response, tolerating code fences and surrounding prose."""
+    try:
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        match = _JSON_OBJECT_RE.search(text)
+        if not match:
+            return None
+        try:
+            data = orjson.loads(match.group(0))
+        except orjson.JSONDecodeError:
+            return None
+    return data if isinstance(data, dict) else None
+
+
+def _parse_verdict(text: str) -> Optional[bool]:
+    """Map the CONSISTENT/INCONSISTENT/UNVERIFIED verdict a reply leads with to is_consistent."""
+    # Only the head is scanned: verdicts come first, and replies can be long
+    match = _VERDICT_RE.match(text, 0, 64)
+    if match is None:
+        return None
+    return _VERDICTS[match.group(1).upper()]
+
+
+async def verify_claim(client: CortexAgentClient, claim: dict) -> ClaimVerification:
+    """Verify a single claim independently, answering and comparing in one agent call."""
+    question = claim.get('verification_question', '')
+    
+    verification_prompt = f"""VERIFICATION QUESTION:
+{question}
 
 ORIGINAL CLAIM:
-{claim.get('claim', '')}
+{claim.get('claim', '')}"""
 
-VERIFIED INFORMATION:
-{verification_response.text}
+    response = await client.arun(verification_prompt, system_prompt=VERIFICATION_SYSTEM)
+    
+    return _build_verification(claim, response, _parse_json_object(response.text))
 
-Respond with exactly one of these first, then explain:
-- CONSISTENT: if the claim matches the verified information
-- INCONSISTENT: if the claim contradicts the verified information  
-- UNVERIFIED: if you cannot determine from the information
 
-Your response:"""
+async def verify_claims_concurrently(client: CortexAgentClient, claims: list[tuple[int, dict]], on_result) -> None:
+    """
+    Verify numbered claims concurrently on one event loop.
+    
+    on_result(i, verification) is called from the loop as each claim
+    completes, so it can safely update Streamlit elements.
+    """
+    semaphore = asyncio.Semaphore(MAX_VERIFICATION_WORKERS)
+    
+    async def verify(i: int, claim: dict) -> tuple[int, ClaimVerification]:
+        async with semaphore:
+            return i, await verify_claim(client, claim)
+    
+    try:
+        for completed in asyncio.as_completed([verify(i, claim) for i, claim in claims]):
+            on_result(*await completed)
+    finally:
+        # The async connection pool belongs to this event loop
+        await client.aclose()
 
-    comparison_response = client.run(comparison_prompt)
+
+def verify_claims_batched(client: CortexAgentClient, claims: list[dict]) -> dict[int, ClaimVerification]:
+    """
+    Verify several claims in a single agent call.
     
-    # Parse consistency
-    response_upper = comparison_response.text.upper()
-    is_consistent = None
-    if 'CONSISTENT' in response_upper and 'INCONSISTENT' not in response_upper:
-        is_consistent = True
-    elif 'INCONSISTENT' in response_upper:
-        is_consistent = False
+    Returns verifications keyed by claim number (1-based). Claims missing from
+    the reply, or all of them if it isn't valid JSON, are left out so the
+    caller can verify them individually.
+    """
+    batch_prompt = "\n".join(
+        f"{i}. CLAIM: {claim.get('claim', '')}\n"
+        f"   QUESTION: {claim.get('verification_question', '')}\n"
+        f"   SOURCE: {claim.get('source', 'analyst')}"
+        for i, claim in enumerate(claims, 1)
+    )
+    
+    response = client.run(batch_prompt, system_prompt=BATCH_VERIFICATION_SYSTEM)
+    
+    data = _parse_json_object(response.text)
+    items = data.get('results') if data else None
+    if not isinstance(items, list):
+        return {}
+    
+    verifications = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            i = int(item.get('claim_idx'))
+        except (TypeError, ValueError):
+            continue
+        if 1 <= i <= len(claims) and i not in verifications:
+            verifications[i] = _build_verification(claims[i - 1], response, item, batched=True)
+    
+    return verifications
+
+
+def _build_verification(
+    claim: dict, response: AgentResponse, result: Optional[dict], batched: bool = False
+) -> ClaimVerification:
+    """
+    Build a ClaimVerification from an agent reply and its parsed JSON verdict.
+    
+    A batched reply's tool calls cover every claim in the batch and can't be
+    attributed to one of them, so they're kept only on comparison_response.
+    """
+    if result is None:
+        # Model ignored the JSON format; treat the whole reply as the comparison
+        verified_text = explanation = response.text
+        is_consistent = _parse_verdict(response.text)
+    else:
+        verified_text = str(result.get('verified_text', ''))
+        explanation = str(result.get('explanation', ''))
+        is_consistent = _parse_verdict(str(result.get('verdict', '')))
     
     return ClaimVerification(
         claim=claim.get('claim', ''),
-        verification_question=question,
+        verification_question=claim.get('verification_question', ''),
         source=claim.get('source', 'analyst'),
-        verification_response=verification_response,
-        comparison_response=comparison_response,
+        # Same agent call, with the text narrowed to the verified answer for display
+        verification_response=(
+            replace(response, texts=[verified_text], tool_calls=[], tool_results=[])
+            if batched
+            else replace(response, texts=[verified_text])
+        ),
+        comparison_response=response,
         is_consistent=is_consistent,
-        explanation=comparison_response.text
+        explanation=explanation
     )
 
 
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def cached_verify_claims_batched(_client: CortexAgentClient, claims: list[dict]) -> dict[int, ClaimVerification]:
+    """verify_claims_batched memoized on the list of claims."""
+    return verify_claims_batched(_client, claims)
+
+
+def _html_text(text: str) -> str:
+    """Escape text for an HTML card, keeping line breaks and literal dollar signs."""
+    return html.escape(text).replace("$", "&#36;").replace("\n", "<br>")
+
+
+def _html_code(code: str) -> str:
+    """Escape code for a <pre> block in an HTML card, keeping line breaks and literal dollar signs."""
+    # Newlines as references too: a blank line would end the card's HTML block
+    return html.escape(code).replace("$", "&#36;").replace("\n", "&#10;")
+
+
 def display_verification_result(v: ClaimVerification, index: int, container):
-    """Display a single verification result."""
-    if v.is_consistent is True:
-        status_icon = "✅"
-        status_text = "CONSISTENT"
-    elif v.is_consistent is False:
-        status_icon = "❌"
-        status_text = "INCONSISTENT"
-    else:
-        status_icon = "⚠️"
-        status_text = "UNVERIFIED"
+    """Display a single verification result as one HTML card."""
+    icon, label, css_class = _STATUS[v.is_consistent]
     
-    with container.expander(f"{status_icon} Claim {index}: {v.claim[:60]}... [{status_text}]", expanded=v.is_consistent is False):
-        st.markdown(f"**Original Claim:** {v.claim}")
-        st.markdown(f"**Verification Question:** {v.verification_question}")
-        st.markdown(f"**Source:** `{v.source.upper()}`")
-        
-        st.divider()
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### 🔎 Verification Query")
-            display_agent_response(v.verification_response, "Independent Verification Result:")
-        
-        with col2:
-            st.markdown("### ⚖️ Comparison")
-            st.markdown("**Comparison Analysis:**")
-            
-            if v.is_consistent is True:
-                st.success(v.explanation)
-            elif v.is_consistent is False:
-                st.error(v.explanation)
-            else:
-                st.warning(v.explanation)
+    sql_queries = v.verification_response.sql_queries
+    sql_block = ""
+    if sql_queries:
+        sql_block = (
+            f"<details><summary>📝 SQL Queries ({len(sql_queries)})</summary>"
+            + "".join(f"<pre><code>{_html_code(sql)}</code></pre>" for sql in sql_queries)
+            + "</details>"
+        )
+    
+    container.markdown(
+        _CARD_TEMPLATE.format_map({
+            "icon": icon,
+            "label": label,
+            "css_class": css_class,
+            "index": index,
+            "claim": _html_text(v.claim),
+            "question": _html_text(v.verification_question),
+            "source": html.escape(v.source.upper()),
+            "verified": _html_text(v.verification_response.text or "No text response"),
+            "sql_block": sql_block,
+            "explanation": _html_text(v.explanation),
+        }),
+        unsafe_allow_html=True,
+    )
 
 
 def main():
     init_session_state()
+    st.html(_CSS)
     
     st.title("🔍 Chain of Verification (CoVe)")
     st.markdown("**Verify Cortex Agent responses using Cortex Analyst, Knowledge Search, and Product Search**")
@@ -284,16 +503,8 @@ def main():
     with st.sidebar:
         st.header("📝 Sample Questions")
         
-        sample_questions = [
-            "What was total revenue in Q4 2024?",
-            "What is our return policy for electronics?",
-            "Tell me about the SmartWatch Pro product",
-            "Which customer segment had highest revenue?",
-            "What was Enterprise revenue in Q4 2024 and what products do we have?",
-        ]
-        
-        for q in sample_questions:
-            if st.button(q[:40] + "..." if len(q) > 40 else q, key=f"sample_{hash(q)}", use_container_width=True):
+        for q, label, key in _SAMPLE_QUESTIONS:
+            if st.button(label, key=key, use_container_width=True):
                 st.session_state.selected_query = q
                 st.rerun()
     
@@ -315,27 +526,30 @@ def main():
     # Run CoVe with streaming output
     if run_button and query:
         start_time = time.time()
-        client = CortexAgentClient()
+        client = get_agent_client()
         
         # ========== STEP 1: Initial Agent Response ==========
-        st.markdown('<div class="step-header"><h2>📤 STEP 1: Initial Agent Response</h2></div>', unsafe_allow_html=True)
+        st.html(_STEP1_HEADER)
         
         step1_status = st.empty()
         step1_status.info("⏳ Querying Cortex Agent...")
         
-        initial_response = client.run(query)
+        st.markdown(f"**Query:** {query}")
+        
+        # Stream the answer as it arrives, then swap in the full response view
+        step1_output = st.empty()
+        initial_response = stream_agent_response(client, query, step1_output)
         
         step1_status.success("✅ Initial response received!")
         
-        st.markdown(f"**Query:** {query}")
-        display_agent_response(initial_response, "Agent Response:")
+        display_agent_response(initial_response, "Agent Response:", step1_output.container())
         
         # Extract claims
         st.markdown("---")
         claims_status = st.empty()
         claims_status.info("⏳ Extracting claims from response...")
         
-        claims, extraction_response = extract_claims(client, query, initial_response.text)
+        claims, extraction_response = cached_extract_claims(client, query, initial_response.text)
         
         claims_status.success(f"✅ Extracted {len(claims)} claims for verification")
         
@@ -344,48 +558,49 @@ def main():
             st.markdown(f"{i}. **{claim.get('claim', '')}** (Source: `{claim.get('source', 'unknown')}`)")
         
         # ========== STEP 2: Verification Results (Streaming) ==========
-        st.markdown('<div class="step-header"><h2>🔍 STEP 2: Independent Verification (Streaming)</h2></div>', unsafe_allow_html=True)
+        st.html(_STEP2_HEADER)
         
         # Create container for streaming results
         verification_container = st.container()
         
-        # Track results
-        verifications = []
-        consistent_count = 0
-        inconsistent_count = 0
-        unverified_count = 0
+        # Track results, keyed by claim number so completion order doesn't matter
+        results: dict[int, ClaimVerification] = {}
         
         # Progress tracking
         progress_bar = st.progress(0)
         progress_text = st.empty()
         
-        # Verify each claim and display immediately
-        for i, claim in enumerate(claims, 1):
-            progress_text.info(f"⏳ Verifying claim {i}/{len(claims)}: {claim.get('claim', '')[:50]}...")
-            
-            # Verify this claim
-            verification = verify_claim(client, claim)
-            verifications.append(verification)
-            
-            # Update counts
-            if verification.is_consistent is True:
-                consistent_count += 1
-            elif verification.is_consistent is False:
-                inconsistent_count += 1
-            else:
-                unverified_count += 1
-            
-            # Display immediately in the container
+        def show_verification(i: int, verification: ClaimVerification):
+            results[i] = verification
             display_verification_result(verification, i, verification_container)
+            progress_bar.progress(len(results) / len(claims))
+            progress_text.info(f"⏳ Verified {len(results)}/{len(claims)} claims...")
+        
+        # Verify all claims in one agent call when there are several
+        if len(claims) > 1:
+            progress_text.info(f"⏳ Verifying {len(claims)} claims in one batched agent call...")
+            
+            for i, verification in sorted(cached_verify_claims_batched(client, claims).items()):
+                show_verification(i, verification)
+        
+        # Verify anything the batch didn't cover concurrently, displaying each one
+        # as it completes. The event loop runs on this script thread.
+        pending = [(i, claim) for i, claim in enumerate(claims, 1) if i not in results]
+        if pending:
+            progress_text.info(f"⏳ Verifying {len(pending)} claims in parallel...")
             
-            # Update progress
-            progress_bar.progress(i / len(claims))
+            asyncio.run(verify_claims_concurrently(client, pending, show_verification))
+        
+        verifications = [results[i] for i in sorted(results)]
+        consistent_count = sum(v.is_consistent is True for v in verifications)
+        inconsistent_count = sum(v.is_consistent is False for v in verifications)
+        unverified_count = sum(v.is_consistent is None for v in verifications)
         
         progress_text.success(f"✅ All {len(claims)} claims verified!")
         progress_bar.empty()
         
         # ========== STEP 3: Comparison & Final Result ==========
-        st.markdown('<div class="step-header"><h2>📊 STEP 3: Comparison & Final Result</h2></div>', unsafe_allow_html=True)
+        st.html(_STEP3_HEADER)
         
         # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -396,46 +611,45 @@ def main():
         
         # Comparison table
         st.markdown("### Verification Summary Table")
-        import pandas as pd
         comparison_data = []
         for i, v in enumerate(verifications, 1):
-            status = "✅ Consistent" if v.is_consistent else ("❌ Inconsistent" if v.is_consistent is False else "⚠️ Unverified")
+            icon, label, _ = _STATUS[v.is_consistent]
             comparison_data.append({
                 "#": i,
                 "Claim": v.claim[:50] + "..." if len(v.claim) > 50 else v.claim,
                 "Source": v.source.upper(),
-                "Status": status,
+                "Status": f"{icon} {label.title()}",
                 "Verified Value": v.verification_response.text[:100] + "..." if len(v.verification_response.text) > 100 else v.verification_response.text
             })
         
-        st.dataframe(pd.DataFrame(comparison_data), use_container_width=True, hide_index=True)
+        st.dataframe(comparison_data, use_container_width=True, hide_index=True)
         
         # Generate corrected response if needed
         final_response = None
         if inconsistent_count > 0:
             st.markdown("### 🔄 Generating Corrected Response...")
             
-            correction_parts = []
-            for v in verifications:
-                status = "CONSISTENT" if v.is_consistent else ("INCONSISTENT" if v.is_consistent is False else "UNVERIFIED")
-                correction_parts.append(f"- Claim: {v.claim}\n  Status: {status}")
-                if v.is_consistent is False:
-                    correction_parts.append(f"  Correct Info: {v.verification_response.text[:200]}")
+            # Only the claims that need fixing; consistent ones are already in the original response
+            correction_parts = [
+                f"- Claim: {v.claim}\n  Correct Info: {v.verification_response.text[:200]}"
+                for v in verifications
+                if v.is_consistent is False
+            ]
             
-            correction_prompt = f"""Generate a corrected response based on verification results.
-
-ORIGINAL QUESTION: {query}
+            correction_prompt = f"""ORIGINAL QUESTION: {query}
 
 ORIGINAL RESPONSE: {initial_response.text}
 
-VERIFICATION RESULTS:
+INCONSISTENT CLAIMS:
 {chr(10).join(correction_parts)}
 
-Generate a revised response that corrects any INCONSISTENT claims using the verified information.
-
 Corrected Response:"""
             
-            final_response = client.run(correction_prompt)
+            correction_output = st.empty()
+            final_response = stream_agent_response(
+                client, correction_prompt, correction_output, system_prompt=CORRECTION_SYSTEM
+            )
+            correction_output.empty()
         
         # Side by side comparison
         st.markdown("### Response Comparison")
@@ -459,6 +673,7 @@ Corrected Response:"""
         execution_time = time.time() - start_time
         st.sidebar.metric("⏱️ Total Time", f"{execution_time:.1f}s")
         st.sidebar.metric("📊 Verification Score", f"{consistent_count}/{len(verifications)}")
+        st.sidebar.metric("💾 Cache Hit Rate", f"{client.cache.stats()['hit_rate']:.0%}")
         
         # Export
         st.divider()
@@ -490,7 +705,7 @@ Corrected Response:"""
         
         st.download_button(
             "📥 Export Full CoVe Results (JSON)",
-            data=json.dumps(export_data, indent=2, default=str),
+            data=orjson.dumps(export_data, option=orjson.OPT_INDENT_2, default=str),
             file_name="cove_full_results.json",
             mime="application/json"
         )
@@ -2,29 +2,38 @@
 Configuration settings for the CoVe project.
 """
 
+import functools
 import os
 from dataclasses import dataclass, field
 from typing import Optional
 
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
 
-@dataclass
+# Snowflake CLI connection config, resolved once at import
+SNOWFLAKE_CONFIG_PATH = os.path.expanduser("~/.snowflake/config.toml")
+
+
+@dataclass(frozen=True, slots=True)
 class SnowflakeConfig:
-    """Snowflake connection configuration."""
-    account: str = field(default_factory=lambda: os.getenv("SNOWFLAKE_ACCOUNT", ""))
-    user: str = field(default_factory=lambda: os.getenv("SNOWFLAKE_USER", ""))
-    password: str = field(default_factory=lambda: os.getenv("SNOWFLAKE_PASSWORD", ""))
-    role: str = field(default_factory=lambda: os.getenv("SNOWFLAKE_ROLE", ""))
-    warehouse: str = field(default_factory=lambda: os.getenv("SNOWFLAKE_WAREHOUSE", "COVE_WH"))
-    database: str = "COVE_PROJECT_DB"
+    """Snowflake connection configuration (environment read once at import)."""
+    account: str = os.getenv("SNOWFLAKE_ACCOUNT", "")
+    user: str = os.getenv("SNOWFLAKE_USER", "")
+    password: str = os.getenv("SNOWFLAKE_PASSWORD", "")
+    role: str = os.getenv("SNOWFLAKE_ROLE", "")
+    # Empty unless set, so config.toml wins over the client's COMPUTE_WH /
+    # COVE_PROJECT_DB fallbacks
+    warehouse: str = os.getenv("SNOWFLAKE_WAREHOUSE", "")
+    database: str = ""
     schema: str = "RAW_DATA"
     
     # Optional: Use connection name from Snowflake CLI config
-    connection_name: Optional[str] = field(
-        default_factory=lambda: os.getenv("SNOWFLAKE_CONNECTION_NAME", "default")
-    )
+    connection_name: Optional[str] = os.getenv("SNOWFLAKE_CONNECTION_NAME", "default")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CortexConfig:
     """Cortex AI service configuration."""
     # Models for different CoVe stages
@@ -47,7 +56,7 @@ class CortexConfig:
     max_tokens: int = 4096
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CoVeConfig:
     """Chain of Verification workflow configuration."""
     # Maximum verification questions to generate
@@ -71,7 +80,7 @@ class CoVeConfig:
     total_timeout: int = 120
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Main configuration container."""
     snowflake: SnowflakeConfig = field(default_factory=SnowflakeConfig)
@@ -80,13 +89,25 @@ class Config:
     
     @classmethod
     def from_env(cls) -> "Config":
-        """Create configuration from environment variables."""
-        return cls(
-            snowflake=SnowflakeConfig(),
-            cortex=CortexConfig(),
-            cove=CoVeConfig()
-        )
+        """Get the configuration read from environment variables at import."""
+        return config
+
+
+# Default configuration instance, shared by every caller
+config = Config()
+
+
+def load_toml(path: str) -> dict:
+    """
+    Parse a TOML file, reusing the parsed result until the file changes.
+    
+    The returned dict is shared between callers and must not be modified.
+    """
+    return _load_toml(path, os.path.getmtime(path))
 
 
-# Default configuration instance
-config = Config.from_env()
+@functools.lru_cache(maxsize=8)
+def _load_toml(path: str, mtime: float) -> dict:
+    # mtime is part of the cache key, so editing the file invalidates it
+    with open(path, "rb") as f:
+        return tomllib.load(f)
@@ -3,8 +3,11 @@ Cortex module - Wrappers for Snowflake Cortex AI services.
 """
 
 from .agent import CortexAgentClient, AgentResponse
+from .cache import CachedCortexAgent, LLMCache
 
 __all__ = [
     "CortexAgentClient",
     "AgentResponse",
+    "CachedCortexAgent",
+    "LLMCache",
 ]
@@ -2,44 +2,178 @@
 Cortex Agent REST API client for interacting with Snowflake Cortex Agents.
 """
 
-import json
+import asyncio
+import functools
 import logging
 import os
-import requests
-import toml
-from dataclasses import dataclass, field
+import weakref
+import httpx
+import orjson
+from dataclasses import asdict, dataclass, field
 from typing import Any, Generator, Optional
 
+from ..config import SNOWFLAKE_CONFIG_PATH, load_toml
+
 logger = logging.getLogger(__name__)
 
+# PAT from the environment, read once at import
+_PAT_ENV = os.getenv("SNOWFLAKE_PAT")
+
+# Seconds to wait for a connection; read timeouts are set per request
+CONNECT_TIMEOUT = 5.0
+
+# Server-Sent Events field prefixes, matched on raw bytes
+_PFX_DATA = b"data:"
+_PFX_EVENT = b"event:"
+
+# Fixed framing of an agent run request body
+_RUN_BODY_PREFIX = b'{"messages":[{"role":"user","content":['
+_TEXT_BLOCK_PREFIX = b'{"type":"text","text":'
+
+# Payload of empty and "[DONE]" events, shared rather than allocated per event;
+# handlers that keep the payload must not keep this one
+_EMPTY_DATA: dict = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentResponse:
     """Response from Cortex Agent."""
     request_id: str
     texts: list[str] = field(default_factory=list)
     citations: list[dict] = field(default_factory=list)
-    sql_queries: list[str] = field(default_factory=list)
     tool_calls: list[dict] = field(default_factory=list)
     tool_results: list[dict] = field(default_factory=list)
     thinking: list[str] = field(default_factory=list)
     status_messages: list[str] = field(default_factory=list)
     final_response: Optional[dict] = None
-    raw_events: list[dict] = field(default_factory=list)  # Store all raw events
+    raw_events: list[dict] = field(default_factory=list)  # All raw events, if capture_raw_events is set
+    # Joined fragments, cached with the fragment count they were joined from;
+    # the lists only ever grow, so a new count means the cache is stale
+    _text: tuple[int, str] = field(default=(0, ""), init=False, repr=False, compare=False)
+    _thinking_text: tuple[int, str] = field(default=(0, ""), init=False, repr=False, compare=False)
+    _sql_queries: Optional[tuple[int, list[str]]] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def text(self) -> str:
         """Get combined text response."""
-        return "".join(self.texts)
+        count, text = self._text
+        if count != len(self.texts):
+            count, text = self._text = (len(self.texts), "".join(self.texts))
+        return text
     
     @property
     def thinking_text(self) -> str:
         """Get combined thinking text."""
-        return "".join(self.thinking)
+        count, text = self._thinking_text
+        if count != len(self.thinking):
+            count, text = self._thinking_text = (len(self.thinking), "".join(self.thinking))
+        return text
+    
+    @property
+    def sql_queries(self) -> list[str]:
+        """Get SQL generated by tool calls (extracted from tool_results when first read)."""
+        if self._sql_queries is None or self._sql_queries[0] != len(self.tool_results):
+            self._sql_queries = (len(self.tool_results), _extract_sql(self.tool_results))
+        return self._sql_queries[1]
     
     def get_tool_results(self) -> list[dict]:
         """Get results from tool calls."""
         return self.tool_results
+    
+    def to_dict(self) -> dict:
+        """Serialize the response to a JSON-compatible dict (raw events excluded)."""
+        data = asdict(self)
+        for name in ("raw_events", "_text", "_thinking_text", "_sql_queries"):
+            data.pop(name, None)
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "AgentResponse":
+        """Rebuild a response serialized with to_dict."""
+        # Older entries stored sql_queries, which is now derived from tool_results
+        data = {k: v for k, v in data.items() if k != "sql_queries"}
+        return cls(**data)
+
+
+def _extract_sql(tool_results: list[dict]) -> list[str]:
+    """Collect the SQL statements in tool results - content can be a list or dict."""
+    # Exact type checks: the content is decoded JSON, so never a subclass
+    sql_queries = []
+    for tool_result in tool_results:
+        content = tool_result.get("content", [])
+        if type(content) is list:
+            for item in content:
+                if type(item) is dict:
+                    json_data = item.get("json")
+                    if type(json_data) is dict and (sql := json_data.get("sql")):
+                        sql_queries.append(sql)
+        elif type(content) is dict and (sql := content.get("sql")):
+            sql_queries.append(sql)
+    return sql_queries
+
+
+class _SSEParser:
+    """Incremental Server-Sent Events parser, fed raw network chunks."""
+    
+    __slots__ = ("pending", "scanned", "cr", "buf")
+    
+    def __init__(self):
+        # Received bytes not yet parsed into events
+        self.pending = bytearray()
+        # Length of pending already searched for an event boundary
+        self.scanned = 0
+        # Whether the last chunk ended in a CR whose LF may open the next one
+        self.cr = False
+        # Data lines of the current event, reused across events
+        self.buf = bytearray()
+    
+    def feed(self, chunk: bytes) -> list[tuple[str, bytes]]:
+        """Consume a chunk, returning the (event, data) pairs it completes."""
+        if self.cr:
+            chunk = b"\r" + chunk
+            self.cr = False
+        if b"\r" in chunk:
+            # Normalize CRLF and bare CR line endings so every event boundary
+            # is a blank "\n\n"
+            if chunk.endswith(b"\r"):
+                chunk, self.cr = chunk[:-1], True
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        self.pending += chunk
+        
+        # Locate whole events with C-level searches, then split each into lines
+        events = []
+        start = 0
+        while (end := self.pending.find(b"\n\n", max(start, self.scanned))) != -1:
+            event = self._parse_event(self.pending[start:end])
+            if event is not None:
+                events.append(event)
+            start = end + 2
+        
+        del self.pending[:start]
+        # A boundary may still straddle the last byte and the next chunk
+        self.scanned = max(len(self.pending) - 1, 0)
+        return events
+    
+    def close(self) -> list[tuple[str, bytes]]:
+        """Flush the final event at the end of the stream."""
+        return self.feed(b"\n\n")
+    
+    def _parse_event(self, block: bytes) -> Optional[tuple[str, bytes]]:
+        event = None
+        for line in block.split(b"\n"):
+            # Most frequent first; anything else, such as ": keep-alive"
+            # comments, is ignored
+            if line.startswith(_PFX_DATA):
+                self.buf += line[len(_PFX_DATA):].strip()
+                self.buf += b"\n"
+            elif line.startswith(_PFX_EVENT):
+                event = line[len(_PFX_EVENT):].strip().decode()
+        
+        data = bytes(self.buf).strip()
+        self.buf.clear()
+        if event is None:
+            return None
+        return event, data
 
 
 class CortexAgentClient:
@@ -52,6 +186,7 @@ class CortexAgentClient:
         schema: str = "CORTEX_SERVICES",
         agent_name: str = "COVE_BUSINESS_AGENT",
         pat: Optional[str] = None,
+        capture_raw_events: bool = False,
     ):
         """
         Initialize the Cortex Agent client.
@@ -62,33 +197,98 @@ class CortexAgentClient:
             schema: Schema containing the agent
             agent_name: Name of the agent
             pat: Programmatic Access Token for authentication
+            capture_raw_events: Keep every parsed SSE event in
+                AgentResponse.raw_events, for debugging
         """
         self.database = database
         self.schema = schema
         self.agent_name = agent_name
+        self._capture_raw = capture_raw_events
         
         # Get account and credentials from config
         config = self._load_config()
         self.account = account or config.get("account", "").replace(".snowflakecomputing.com", "")
         # PAT can be in env var, passed directly, or stored as 'password' in config.toml
-        self.pat = pat or os.getenv("SNOWFLAKE_PAT") or config.get("password") or config.get("pat")
+        self.pat = pat or _PAT_ENV or config.get("password") or config.get("pat")
         
         # Build base URL
         if "." not in self.account:
             self.base_url = f"https://{self.account}.snowflakecomputing.com"
         else:
             self.base_url = f"https://{self.account}"
+        
+        # Request URLs and headers are fixed per client, build them once
+        # (authorization is set on the HTTP client)
+        agents_url = f"{self.base_url}/api/v2/databases/{self.database}/schemas/{self.schema}/agents"
+        self._agent_url = f"{agents_url}/{self.agent_name}"
+        self._run_url = f"{self._agent_url}:run"
+        self._threads_url = f"{self.base_url}/api/v2/cortex/threads"
+        self._json_headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        self._sse_headers = {"Content-Type": "application/json", "Accept": "text/event-stream"}
+        
+        # Event type -> handler; response.thinking repeats the streamed
+        # thinking deltas in full, so it is deliberately not handled
+        self._handlers = {
+            "response.text": self._on_text,
+            "response.text.delta": self._on_text,
+            "message.delta": self._on_message_delta,
+            "response.thinking.delta": self._on_thinking_delta,
+            "response.status": self._on_status,
+            "response.tool_use": self._on_tool_use,
+            "response.tool_result": self._on_tool_result,
+            "response.tool_result.status": self._on_tool_result_status,
+            "citation": self._on_citation,
+            "response": self._on_response,
+            "error": self._on_error,
+        }
+        
+        # One pooled HTTP/2 client for every request, so repeated and parallel
+        # calls share connections instead of each paying for a TLS handshake
+        self._http_options = {
+            "http2": True,
+            "headers": {"Authorization": f"Bearer {self.pat}"},
+            "limits": httpx.Limits(max_keepalive_connections=32, max_connections=32),
+            "timeout": httpx.Timeout(30.0, connect=CONNECT_TIMEOUT),
+        }
+        self._client = httpx.Client(**self._http_options)
+        # Async clients are bound to the event loop that created them
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Close the pool when the client is garbage collected or at interpreter exit
+        self._finalizer = weakref.finalize(self, self._client.close)
+    
+    def __enter__(self) -> "CortexAgentClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._finalizer()
+    
+    def _async_client(self) -> httpx.AsyncClient:
+        """Get the async HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = httpx.AsyncClient(**self._http_options)
+        return client
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP connection pool of the running event loop."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
     
     def _load_config(self) -> dict:
         """Load Snowflake configuration from config.toml."""
-        config_path = os.path.expanduser("~/.snowflake/config.toml")
-        
-        if not os.path.exists(config_path):
+        if not os.path.exists(SNOWFLAKE_CONFIG_PATH):
             return {}
         
         try:
-            with open(config_path, "r") as f:
-                toml_config = toml.load(f)
+            toml_config = load_toml(SNOWFLAKE_CONFIG_PATH)
             
             # Get default connection
             if "connections" in toml_config:
@@ -101,47 +301,140 @@ class CortexAgentClient:
             logger.warning(f"Failed to load config: {e}")
             return {}
     
-    def _get_headers(self, accept: str = "application/json") -> dict:
-        """Get request headers."""
-        return {
-            "Authorization": f"Bearer {self.pat}",
-            "Content-Type": "application/json",
-            "Accept": accept,
-        }
-    
-    def _agents_url(self) -> str:
-        """Get the agents API URL."""
-        return f"{self.base_url}/api/v2/databases/{self.database}/schemas/{self.schema}/agents"
-    
-    def _iter_sse(self, response) -> Generator[tuple[str, str], None, None]:
+    def _iter_sse(self, response) -> Generator[tuple[str, bytes], None, None]:
         """Parse Server-Sent Events stream."""
-        event = None
-        buf = []
+        parser = _SSEParser()
         
-        for raw in response.iter_lines():
-            if raw is None:
-                continue
-            
-            line = raw.decode("utf-8", errors="ignore")
-            
-            # Skip keep-alive comments
-            if line.startswith(": keep-alive"):
-                continue
-            
-            if line.startswith("event:"):
-                event = line.split("event:", 1)[1].strip()
-            elif line.startswith("data:"):
-                buf.append(line.split("data:", 1)[1].strip())
-            elif line.strip() == "":
-                if event is not None:
-                    data = "\n".join(buf).strip()
-                    yield event, data
-                event, buf = None, []
+        # Chunks are yielded as they arrive, so text still streams token by token
+        for chunk in response.iter_bytes():
+            yield from parser.feed(chunk)
         
         # Handle final event
-        if event is not None:
-            data = "\n".join(buf).strip()
-            yield event, data
+        yield from parser.close()
+    
+    def _run_body(
+        self,
+        message: str,
+        thread_id: Optional[int],
+        parent_message_id: int,
+        tool_choice: Optional[dict],
+        system_prompt: Optional[str],
+    ) -> bytes:
+        """Build the JSON body of an agent run request."""
+        # Only the texts and optional fields are serialized, the rest is fixed:
+        # {"messages": [{"role": "user", "content": [<text blocks>]}], ...}
+        parts = [_RUN_BODY_PREFIX]
+        if system_prompt:
+            parts += (_TEXT_BLOCK_PREFIX, orjson.dumps(system_prompt), b"},")
+        parts += (_TEXT_BLOCK_PREFIX, orjson.dumps(message), b"}]}]")
+        
+        if thread_id is not None:
+            parts += (b',"thread_id":', orjson.dumps(thread_id))
+            parts += (b',"parent_message_id":', orjson.dumps(parent_message_id))
+        
+        if tool_choice:
+            parts += (b',"tool_choice":', orjson.dumps(tool_choice))
+        
+        parts.append(b"}")
+        return b"".join(parts)
+    
+    def _handle_event(self, result: AgentResponse, current_tool_use: dict, event: str, data: bytes) -> None:
+        """Apply one Server-Sent Event to the response being assembled."""
+        # Parse once; every handler reads the same dict
+        try:
+            d = _EMPTY_DATA if not data or data == b"[DONE]" else orjson.loads(data)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Failed to parse event data: {data[:100]!r}")
+            d = None
+        
+        # Store raw event for debugging
+        if self._capture_raw:
+            result.raw_events.append({
+                "event": event,
+                "data": {"raw": data.decode(errors="replace")} if d is None else d or {}
+            })
+        if d is None:
+            return
+        
+        handler = self._handlers.get(event)
+        if handler is None:
+            return
+        
+        try:
+            handler(d, result, current_tool_use)
+        except RuntimeError:
+            raise
+        except Exception as e:
+            logger.warning(f"Error processing event {event}: {e}")
+    
+    def _on_text(self, d: dict, result: AgentResponse, current_tool_use: dict) -> None:
+        if isinstance(d.get("text"), str):
+            result.texts.append(d["text"])
+    
+    def _on_message_delta(self, d: dict, result: AgentResponse, current_tool_use: dict) -> None:
+        delta = d.get("delta", {})
+        for c in delta.get("content", []):
+            if c.get("type") == "text" and isinstance(c.get("text"), str):
+                result.texts.append(c["text"])
+    
+    def _on_thinking_delta(self, d: dict, result: AgentResponse, current_tool_use: dict) -> None:
+        if isinstance(d.get("text"), str):
+            result.thinking.append(d["text"])
+    
+    def _on_status(self, d: dict, result: AgentResponse, current_tool_use: dict) -> None:
+        msg = d.get("message", "")
+        status = d.get("status", "")
+        if msg:
+            result.status_messages.append(f"{status}: {msg}")
+    
+    def _on_tool_use(self, d: dict, result: AgentResponse, current_tool_use: dict) -> None:
+        tool_info = {
+            "name": d.get("name"),
+            "type": d.get("type"),
+            "input": d.get("input"),
+            "tool_use_id": d.get("tool_use_id"),
+            "status": "started"
+        }
+        result.tool_calls.append(tool_info)
+        current_tool_use[d.get("tool_use_id")] = tool_info
+    
+    def _on_tool_result(self, d: dict, result: AgentResponse, current_tool_use: dict) -> None:
+        tool_use_id = d.get("tool_use_id")
+        tool_result = {
+            "tool_use_id": tool_use_id,
+            "content": d.get("content"),
+            "is_error": d.get("is_error", False)
+        }
+        # SQL is extracted from tool_results only if sql_queries is read
+        result.tool_results.append(tool_result)
+        
+        # Update tool call with result
+        if tool_use_id in current_tool_use:
+            current_tool_use[tool_use_id]["result"] = tool_result
+            current_tool_use[tool_use_id]["status"] = "completed"
+    
+    def _on_tool_result_status(self, d: dict, result: AgentResponse, current_tool_use: dict) -> None:
+        msg = d.get("message", "")
+        status = d.get("status", "")
+        tool_type = d.get("tool_type", "")
+        if msg:
+            result.status_messages.append(f"Tool {tool_type} - {status}: {msg}")
+    
+    def _on_citation(self, d: dict, result: AgentResponse, current_tool_use: dict) -> None:
+        result.citations.append(d or {})
+    
+    def _on_response(self, d: dict, result: AgentResponse, current_tool_use: dict) -> None:
+        result.final_response = d or {}
+        # Extract final text from response if not already captured
+        if not result.texts and "message" in d:
+            msg = d.get("message", {})
+            for c in msg.get("content", []):
+                if c.get("type") == "text":
+                    result.texts.append(c.get("text", ""))
+    
+    def _on_error(self, d: dict, result: AgentResponse, current_tool_use: dict) -> None:
+        error_msg = d.get("message", "Unknown error")
+        raise RuntimeError(f"Agent error: {error_msg}")
     
     def run(
         self,
@@ -150,6 +443,7 @@ class CortexAgentClient:
         parent_message_id: int = 0,
         tool_choice: Optional[dict] = None,
         timeout: int = 300,
+        system_prompt: Optional[str] = None,
     ) -> AgentResponse:
         """
         Run the agent with a message.
@@ -160,42 +454,127 @@ class CortexAgentClient:
             parent_message_id: Parent message ID (0 for new conversation)
             tool_choice: Optional tool choice configuration
             timeout: Request timeout in seconds
+            system_prompt: Optional static instructions sent ahead of the message
             
         Returns:
             AgentResponse with the agent's response
         """
-        url = f"{self._agents_url()}/{self.agent_name}:run"
-        
-        body = {
-            "messages": [
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": message
-                        }
-                    ]
-                }
-            ]
-        }
+        stream = self.stream(
+            message,
+            thread_id=thread_id,
+            parent_message_id=parent_message_id,
+            tool_choice=tool_choice,
+            timeout=timeout,
+            system_prompt=system_prompt,
+        )
+        while True:
+            try:
+                next(stream)
+            except StopIteration as stop:
+                return stop.value
+    
+    def stream(
+        self,
+        message: str,
+        thread_id: Optional[int] = None,
+        parent_message_id: int = 0,
+        tool_choice: Optional[dict] = None,
+        timeout: int = 300,
+        system_prompt: Optional[str] = None,
+    ) -> Generator[str, None, AgentResponse]:
+        """
+        Run the agent with a message, yielding response text as it arrives.
         
-        if thread_id is not None:
-            body["thread_id"] = thread_id
-            body["parent_message_id"] = parent_message_id
+        The complete AgentResponse is the generator's return value, e.g.
+        ``response = yield from client.stream(message)``.
         
-        if tool_choice:
-            body["tool_choice"] = tool_choice
+        Args:
+            message: User message/question
+            thread_id: Optional thread ID for conversation context
+            parent_message_id: Parent message ID (0 for new conversation)
+            tool_choice: Optional tool choice configuration
+            timeout: Request timeout in seconds
+            system_prompt: Optional static instructions sent ahead of the message.
+                Keeping them identical across calls gives every request the same
+                prompt prefix, so it can be reused by the model's prompt cache.
+            
+        Yields:
+            Text fragments of the agent's answer
+            
+        Returns:
+            AgentResponse with the agent's response
+        """
+        body = self._run_body(message, thread_id, parent_message_id, tool_choice, system_prompt)
+        
+        logger.info(f"Sending request to agent: {message[:50]}...")
+        
+        try:
+            with self._client.stream(
+                "POST",
+                self._run_url,
+                headers=self._sse_headers,
+                content=body,
+                timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
+            ) as response:
+                response.raise_for_status()
+                
+                request_id = response.headers.get("X-Snowflake-Request-Id", "")
+                
+                result = AgentResponse(request_id=request_id)
+                current_tool_use = {}
+                
+                for event, data in self._iter_sse(response):
+                    streamed = len(result.texts)
+                    self._handle_event(result, current_tool_use, event, data)
+                    yield from result.texts[streamed:]
+                
+                return result
+                
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error calling agent: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Error calling agent: {e}")
+            raise
+    
+    async def arun(
+        self,
+        message: str,
+        thread_id: Optional[int] = None,
+        parent_message_id: int = 0,
+        tool_choice: Optional[dict] = None,
+        timeout: int = 300,
+        system_prompt: Optional[str] = None,
+    ) -> AgentResponse:
+        """
+        Run the agent with a message on the running event loop.
+        
+        Requests share one HTTP/2 connection pool per event loop, so many
+        calls can be awaited concurrently (e.g. with ``asyncio.gather``).
+        Await aclose() before the loop finishes to release it.
+        
+        Args:
+            message: User message/question
+            thread_id: Optional thread ID for conversation context
+            parent_message_id: Parent message ID (0 for new conversation)
+            tool_choice: Optional tool choice configuration
+            timeout: Request timeout in seconds
+            system_prompt: Optional static instructions sent ahead of the message
+            
+        Returns:
+            AgentResponse with the agent's response
+        """
+        body = self._run_body(message, thread_id, parent_message_id, tool_choice, system_prompt)
         
         logger.info(f"Sending request to agent: {message[:50]}...")
         
         try:
-            with requests.post(
-                url,
-                headers=self._get_headers(accept="text/event-stream"),
-                json=body,
-                stream=True,
-                timeout=timeout
+            async with self._async_client().stream(
+                "POST",
+                self._run_url,
+                headers=self._sse_headers,
+                content=body,
+                timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
             ) as response:
                 response.raise_for_status()
                 
@@ -203,135 +582,19 @@ class CortexAgentClient:
                 
                 result = AgentResponse(request_id=request_id)
                 current_tool_use = {}
+                parser = _SSEParser()
+                
+                async for chunk in response.aiter_bytes():
+                    for event, data in parser.feed(chunk):
+                        self._handle_event(result, current_tool_use, event, data)
                 
-                for event, data_str in self._iter_sse(response):
-                    # Store raw event for debugging
-                    try:
-                        parsed_data = json.loads(data_str) if data_str and data_str != "[DONE]" else {}
-                    except json.JSONDecodeError:
-                        parsed_data = {"raw": data_str}
-                    
-                    result.raw_events.append({
-                        "event": event,
-                        "data": parsed_data
-                    })
-                    
-                    try:
-                        # Handle different event types
-                        if event == "response.text":
-                            d = json.loads(data_str) if data_str else {}
-                            if isinstance(d.get("text"), str):
-                                result.texts.append(d["text"])
-                        
-                        elif event == "response.text.delta":
-                            d = json.loads(data_str) if data_str else {}
-                            if isinstance(d.get("text"), str):
-                                result.texts.append(d["text"])
-                        
-                        elif event == "message.delta":
-                            d = json.loads(data_str) if data_str else {}
-                            delta = d.get("delta", {})
-                            for c in delta.get("content", []):
-                                if c.get("type") == "text" and isinstance(c.get("text"), str):
-                                    result.texts.append(c["text"])
-                        
-                        elif event == "response.thinking.delta":
-                            d = json.loads(data_str) if data_str else {}
-                            if isinstance(d.get("text"), str):
-                                result.thinking.append(d["text"])
-                        
-                        elif event == "response.thinking":
-                            d = json.loads(data_str) if data_str else {}
-                            if isinstance(d.get("text"), str):
-                                # Full thinking text, don't duplicate
-                                pass
-                        
-                        elif event == "response.status":
-                            d = json.loads(data_str) if data_str else {}
-                            msg = d.get("message", "")
-                            status = d.get("status", "")
-                            if msg:
-                                result.status_messages.append(f"{status}: {msg}")
-                        
-                        elif event == "response.tool_use":
-                            d = json.loads(data_str) if data_str else {}
-                            tool_info = {
-                                "name": d.get("name"),
-                                "type": d.get("type"),
-                                "input": d.get("input"),
-                                "tool_use_id": d.get("tool_use_id"),
-                                "status": "started"
-                            }
-                            result.tool_calls.append(tool_info)
-                            current_tool_use[d.get("tool_use_id")] = tool_info
-                        
-                        elif event == "response.tool_result":
-                            d = json.loads(data_str) if data_str else {}
-                            tool_use_id = d.get("tool_use_id")
-                            tool_result = {
-                                "tool_use_id": tool_use_id,
-                                "content": d.get("content"),
-                                "is_error": d.get("is_error", False)
-                            }
-                            result.tool_results.append(tool_result)
-                            
-                            # Extract SQL from tool result - content can be a list or dict
-                            content = d.get("content", [])
-                            if isinstance(content, list):
-                                for item in content:
-                                    if isinstance(item, dict):
-                                        json_data = item.get("json", {})
-                                        if isinstance(json_data, dict):
-                                            sql = json_data.get("sql")
-                                            if sql:
-                                                result.sql_queries.append(sql)
-                            elif isinstance(content, dict):
-                                sql = content.get("sql")
-                                if sql:
-                                    result.sql_queries.append(sql)
-                            
-                            # Update tool call with result
-                            if tool_use_id in current_tool_use:
-                                current_tool_use[tool_use_id]["result"] = tool_result
-                                current_tool_use[tool_use_id]["status"] = "completed"
-                        
-                        elif event == "response.tool_result.status":
-                            d = json.loads(data_str) if data_str else {}
-                            msg = d.get("message", "")
-                            status = d.get("status", "")
-                            tool_type = d.get("tool_type", "")
-                            if msg:
-                                result.status_messages.append(f"Tool {tool_type} - {status}: {msg}")
-                        
-                        elif event == "citation":
-                            d = json.loads(data_str) if data_str else {}
-                            result.citations.append(d)
-                        
-                        elif event == "response":
-                            d = json.loads(data_str) if data_str else {}
-                            result.final_response = d
-                            # Extract final text from response if not already captured
-                            if not result.texts and "message" in d:
-                                msg = d.get("message", {})
-                                for c in msg.get("content", []):
-                                    if c.get("type") == "text":
-                                        result.texts.append(c.get("text", ""))
-                        
-                        elif event == "error":
-                            d = json.loads(data_str) if data_str else {}
-                            error_msg = d.get("message", "Unknown error")
-                            raise RuntimeError(f"Agent error: {error_msg}")
-                        
-                    except json.JSONDecodeError:
-                        logger.warning(f"Failed to parse event data: {data_str[:100]}")
-                    except RuntimeError:
-                        raise
-                    except Exception as e:
-                        logger.warning(f"Error processing event {event}: {e}")
+                # Handle final event
+                for event, data in parser.close():
+                    self._handle_event(result, current_tool_use, event, data)
                 
                 return result
                 
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error calling agent: {e}")
             raise
         except Exception as e:
@@ -348,31 +611,25 @@ class CortexAgentClient:
         Returns:
             Thread ID
         """
-        url = f"{self.base_url}/api/v2/cortex/threads"
-        
-        response = requests.post(
-            url,
-            headers=self._get_headers(),
-            json={"origin_application": origin_application},
-            timeout=30
+        response = self._client.post(
+            self._threads_url,
+            headers=self._json_headers,
+            content=orjson.dumps({"origin_application": origin_application}),
         )
         response.raise_for_status()
         
-        data = response.json()
+        data = orjson.loads(response.content)
         return data.get("thread_id")
     
     def describe_agent(self) -> dict:
         """Get agent configuration details."""
-        url = f"{self._agents_url()}/{self.agent_name}"
-        
-        response = requests.get(
-            url,
-            headers=self._get_headers(),
-            timeout=30
+        response = self._client.get(
+            self._agent_url,
+            headers=self._json_headers,
         )
         response.raise_for_status()
         
-        return response.json()
+        return orjson.loads(response.content)
 
 
 def run_agent(
@@ -393,9 +650,14 @@ def run_agent(
     Returns:
         AgentResponse
     """
-    client = CortexAgentClient(
+    return _shared_client(agent_name, database, schema).run(message)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_client(agent_name: str, database: str, schema: str) -> CortexAgentClient:
+    # One client per agent, so repeated run_agent calls reuse its connections
+    return CortexAgentClient(
         database=database,
         schema=schema,
         agent_name=agent_name,
     )
-    return client.run(message)
@@ -0,0 +1,232 @@
+"""
+Persistent response cache for Cortex Agent calls.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Generator, Optional
+
+from ..config import Config, config as default_config
+from .agent import AgentResponse, CortexAgentClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "~/.cove/llm_cache.sqlite3"
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+class LLMCache:
+    """Exact-match cache of agent responses, persisted to SQLite."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Location of the SQLite cache file
+            ttl: Seconds before a cached response expires
+        """
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, created REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            # Drop entries that expired since the cache was last open
+            self._db.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,))
+            self._db.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"LLM cache disabled, failed to open {self.path}: {e}")
+            self._db = None
+
+    @staticmethod
+    def make_key(prompt: str, **params: Any) -> str:
+        """Build a stable cache key from a prompt and the parameters that affect its answer."""
+        payload = json.dumps({"prompt": prompt, **params}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[AgentResponse]:
+        """Return the cached response for a key, or None on a miss."""
+        if self._db is None:
+            return None
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT created, payload FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and time.time() - row[0] > self.ttl:
+                self._delete(key)
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+        try:
+            response = AgentResponse.from_dict(json.loads(row[1]))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry {key[:12]}: {e}")
+            with self._lock:
+                self._delete(key)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return response
+
+    def _delete(self, key: str) -> None:
+        # Callers hold self._lock
+        try:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to delete cache entry: {e}")
+
+    def set(self, key: str, response: AgentResponse) -> None:
+        """Store a response under a key."""
+        if self._db is None:
+            return
+
+        payload = json.dumps(response.to_dict(), default=str)
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, created, payload) VALUES (?, ?, ?)",
+                    (key, time.time(), payload),
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to write cache entry: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit/miss counters and the hit rate since the cache was opened."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        if self._db is None:
+            return
+
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+class CachedCortexAgent:
+    """CortexAgentClient proxy that serves repeated prompts from an LLMCache."""
+
+    def __init__(self, client: CortexAgentClient, cache: LLMCache, config: Optional[Config] = None):
+        """
+        Initialize the proxy.
+
+        Args:
+            client: Client used for cache misses
+            cache: Response cache
+            config: Configuration object. Uses default if not provided.
+        """
+        self._client = client
+        self.cache = cache
+        self.config = config or default_config
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    @property
+    def enabled(self) -> bool:
+        """Responses are only reusable when sampling is deterministic."""
+        return self.config.cortex.temperature == 0.0
+
+    def _key(self, message: str, **kwargs: Any) -> str:
+        kwargs.pop("timeout", None)
+        return self.cache.make_key(
+            message,
+            # The cache file is shared by every account, so the URL is part of the key
+            agent=f"{self._client.base_url}/{self._client.database}.{self._client.schema}.{self._client.agent_name}",
+            model=self.config.cortex.baseline_model,
+            **kwargs,
+        )
+
+    def _cacheable(self, **kwargs: Any) -> bool:
+        # Threaded conversations depend on server-side state, never cache them
+        return self.enabled and kwargs.get("thread_id") is None
+
+    def _store(self, key: str, response: AgentResponse) -> None:
+        # Don't pin a transient failure for the whole TTL
+        if not response.text or any(r.get("is_error") for r in response.tool_results):
+            return
+        self.cache.set(key, response)
+
+    def run(self, message: str, **kwargs: Any) -> AgentResponse:
+        """Run the agent, returning a cached response when one exists."""
+        if not self._cacheable(**kwargs):
+            return self._client.run(message, **kwargs)
+
+        key = self._key(message, **kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.info(f"Cache hit for agent request: {message[:50]}...")
+            return cached
+
+        response = self._client.run(message, **kwargs)
+        self._store(key, response)
+        return response
+
+    async def arun(self, message: str, **kwargs: Any) -> AgentResponse:
+        """Run the agent asynchronously, returning a cached response when one exists."""
+        if not self._cacheable(**kwargs):
+            return await self._client.arun(message, **kwargs)
+
+        key = self._key(message, **kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.info(f"Cache hit for agent request: {message[:50]}...")
+            return cached
+
+        response = await self._client.arun(message, **kwargs)
+        self._store(key, response)
+        return response
+
+    def stream(self, message: str, **kwargs: Any) -> Generator[str, None, AgentResponse]:
+        """Stream the agent's answer, replaying a cached response in one piece when one exists."""
+        if not self._cacheable(**kwargs):
+            return (yield from self._client.stream(message, **kwargs))
+
+        key = self._key(message, **kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.info(f"Cache hit for agent request: {message[:50]}...")
+            if cached.text:
+                yield cached.text
+            return cached
+
+        response = yield from self._client.stream(message, **kwargs)
+        self._store(key, response)
+        return response
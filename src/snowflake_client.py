@@ -5,14 +5,13 @@ Uses snowflake-connector-python for compatibility.
 
 import logging
 import os
-import toml
 from contextlib import contextmanager
 from typing import Any, Generator, Optional
 
 import snowflake.connector
 from snowflake.connector import DictCursor
 
-from .config import Config, config as default_config
+from .config import SNOWFLAKE_CONFIG_PATH, Config, config as default_config, load_toml
 
 logger = logging.getLogger(__name__)
 
@@ -32,14 +31,11 @@ class SnowflakeClient:
     
     def _get_connection_from_toml(self) -> dict:
         """Get connection parameters from Snowflake CLI config."""
-        config_path = os.path.expanduser("~/.snowflake/config.toml")
-        
-        if not os.path.exists(config_path):
+        if not os.path.exists(SNOWFLAKE_CONFIG_PATH):
             return {}
         
         try:
-            with open(config_path, "r") as f:
-                toml_config = toml.load(f)
+            toml_config = load_toml(SNOWFLAKE_CONFIG_PATH)
             
             connection_name = self.config.snowflake.connection_name or "default"
             
@@ -49,7 +45,8 @@ class SnowflakeClient:
             else:
                 conn_config = toml_config.get(connection_name, {})
             
-            return conn_config
+            # Copy, the parsed file is shared and the caller adds overrides
+            return dict(conn_config)
         except Exception as e:
             logger.warning(f"Failed to read config.toml: {e}")
             return {}
@@ -77,6 +74,11 @@ class SnowflakeClient:
         if sf_config.schema:
             conn_params["schema"] = sf_config.schema
         
+        # Fallbacks when neither the config nor config.toml names them;
+        # applied at login, not with USE statements
+        conn_params.setdefault("warehouse", "COMPUTE_WH")
+        conn_params.setdefault("database", "COVE_PROJECT_DB")
+        
         # Handle authenticator
         if "authenticator" not in conn_params:
             # Check for environment variable
@@ -92,16 +94,6 @@ class SnowflakeClient:
         connection = snowflake.connector.connect(**conn_params)
         logger.info("Connected to Snowflake successfully")
         
-        # Set default warehouse and database
-        cursor = connection.cursor()
-        try:
-            cursor.execute("USE WAREHOUSE COMPUTE_WH")
-            cursor.execute("USE DATABASE COVE_PROJECT_DB")
-        except Exception as e:
-            logger.warning(f"Failed to set default context: {e}")
-        finally:
-            cursor.close()
-        
         return connection
     
     @property
@@ -140,8 +132,27 @@ class SnowflakeClient:
         try:
             with self.get_cursor() as cursor:
                 cursor.execute(sql)
-                results = cursor.fetchall()
-                return list(results) if results else []
+                return cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Query execution failed: {e}")
+            raise
+    
+    def iter_query(self, sql: str, chunk_size: int = 1000) -> Generator[dict[str, Any], None, None]:
+        """
+        Execute a SQL query and yield rows as dicts, fetched in batches.
+        
+        Args:
+            sql: SQL query to execute
+            chunk_size: Number of rows fetched per batch
+            
+        Yields:
+            Dictionaries representing rows
+        """
+        try:
+            with self.get_cursor() as cursor:
+                cursor.execute(sql)
+                while rows := cursor.fetchmany(chunk_size):
+                    yield from rows
         except Exception as e:
             logger.error(f"Query execution failed: {e}")
             raise
@@ -157,10 +168,8 @@ class SnowflakeClient:
             Single value from the first column of the first row
         """
         results = self.execute_query(sql)
-        if results and len(results) > 0:
-            first_row = results[0]
-            if first_row:
-                return list(first_row.values())[0]
+        if results:
+            return next(iter(results[0].values()), None)
         return None
     
     def execute_ddl(self, sql: str) -> None: